@@ -0,0 +1,93 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+# Benchmarks of the thermofeel functions over increasing array sizes.
+# Not collected by the test suite, run with:
+#     python -m pytest tests/bench_scalars.py
+# Each benchmark reports in extra_info the memory traffic per second of the
+# inputs and output (bytes_per_second); functions approaching the memory
+# bandwidth are memory-bound, the others compute-bound.
+
+import numpy as np
+import pytest
+
+import thermofeel as tmf
+
+pytest.importorskip("pytest_benchmark")
+
+SIZES = [1, 1000, 10**6]
+
+
+def inputs(n):
+    rng = np.random.default_rng(0)
+    t2_k = rng.uniform(250.0, 320.0, n)
+    ssrd = rng.uniform(0.0, 1000.0, n)
+    fdir = ssrd * rng.uniform(0.0, 0.8, n)
+    cossza = rng.uniform(0.0, 1.0, n)
+    mrt = t2_k + rng.uniform(-30.0, 70.0, n)
+    va = rng.uniform(0.5, 17.0, n)
+    return {
+        "t2_k": t2_k,
+        "td_k": t2_k - rng.uniform(0.0, 20.0, n),
+        "mrt": mrt,
+        "va": va,
+        "bgt": tmf.calculate_bgt(t2_k, mrt, va),
+        "rh": rng.uniform(5.0, 100.0, n),
+        "ehPa": rng.uniform(1.0, 50.0, n),
+        "phase": rng.integers(0, 2, n),
+        "h": rng.uniform(1.0, 9.0, n),
+        "ssrd": ssrd,
+        "ssr": ssrd * rng.uniform(0.6, 0.9, n),
+        "dsrp": tmf.approximate_dsrp(fdir, cossza),
+        "strd": rng.uniform(200.0, 450.0, n),
+        "fdir": fdir,
+        "strr": -rng.uniform(0.0, 150.0, n),
+        "cossza": cossza,
+    }
+
+
+# function and name of its array inputs
+CASES = [
+    (tmf.calculate_relative_humidity_percent, ["t2_k", "td_k"]),
+    (tmf.calculate_saturation_vapour_pressure, ["t2_k"]),
+    (tmf.calculate_saturation_vapour_pressure_multiphase, ["t2_k", "phase"]),
+    (tmf.calculate_nonsaturation_vapour_pressure, ["t2_k", "rh"]),
+    (tmf.scale_windspeed, ["va", "h"]),
+    (tmf.calculate_dew_point_from_relative_humidity, ["rh", "t2_k"]),
+    (
+        tmf.calculate_mean_radiant_temperature,
+        ["ssrd", "ssr", "dsrp", "strd", "fdir", "strr", "cossza"],
+    ),
+    (tmf.calculate_utci, ["t2_k", "va", "mrt", None, "ehPa"]),
+    (tmf.calculate_wbgt_simple, ["t2_k", "rh"]),
+    (tmf.calculate_wbt, ["t2_k", "rh"]),
+    (tmf.calculate_bgt, ["t2_k", "mrt", "va"]),
+    (tmf.calculate_wbgt, ["t2_k", "mrt", "va", "td_k"]),
+    (tmf.calculate_mrt_from_bgt, ["t2_k", "bgt", "va"]),
+    (tmf.calculate_humidex, ["t2_k", "td_k"]),
+    (tmf.calculate_normal_effective_temperature, ["t2_k", "va", "rh"]),
+    (tmf.calculate_apparent_temperature, ["t2_k", "va", "rh"]),
+    (tmf.calculate_wind_chill, ["t2_k", "va"]),
+    (tmf.calculate_heat_index_simplified, ["t2_k", "rh"]),
+    (tmf.calculate_heat_index_adjusted, ["t2_k", "td_k"]),
+]
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("function, names", CASES, ids=[f.__name__ for f, _ in CASES])
+def test_benchmark(benchmark, function, names, n):
+    data = inputs(n)
+    args = [None if name is None else data[name] for name in names]
+
+    benchmark(function, *args)
+
+    if not benchmark.disabled:
+        # inputs read and output written
+        nbytes = sum(arg.nbytes for arg in args if arg is not None) + n * 8
+        benchmark.extra_info["n"] = n
+        benchmark.extra_info["bytes_per_second"] = nbytes / benchmark.stats.stats.mean
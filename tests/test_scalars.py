@@ -35,6 +35,12 @@ class TestThermalCalculator(unittest.TestCase):
         # assert es == pytest.approx(0.63555512, abs=1e-6) # old formula
         assert es == pytest.approx(0.63142553, abs=1e-6)
 
+    def test_saturation_vapour_pressure_multiphase_scalar(self):
+        t2_k = tmf.celsius_to_kelvin(-25.0)
+        es = tmf.calculate_saturation_vapour_pressure_multiphase(t2_k, 1)
+        assert np.ndim(es) == 0
+        assert es == pytest.approx(0.63142553, abs=1e-6)
+
     def test_nonsaturation_vapour_pressure(self):
         t2_k = np.array([300])
         rh = np.array([87])
@@ -77,6 +83,20 @@ class TestThermalCalculator(unittest.TestCase):
         # print(f"mrt {mrt}")
         assert mrt == pytest.approx(270.85099123, abs=1e-6)
 
+    def test_mean_radiant_temperature_scalar(self):
+        dsrp = tmf.approximate_dsrp(374150.0, 0.4)
+        mrt = tmf.calculate_mean_radiant_temperature(
+            ssrd=60000.0 / 3600,
+            ssr=471818.0 / 3600,
+            fdir=374150.0 / 3600,
+            strd=1061213.0 / 3600,
+            strr=-182697.0 / 3600,
+            cossza=0.4 / 3600,
+            dsrp=dsrp / 3600,
+        )
+        assert np.ndim(mrt) == 0
+        assert mrt == pytest.approx(270.85099123, abs=1e-6)
+
     def test_utci(self):
         t2_k = np.array([309.0])
         va = np.array([3])
@@ -109,6 +129,25 @@ class TestThermalCalculator(unittest.TestCase):
         assert bgt[0, 1] == pytest.approx(298.70218703427656, abs=1e-6)
         assert bgt[0, 2] == pytest.approx(298.70216299754475, abs=1e-6)
 
+    def test_bgt_calm_wind(self):
+        t2_k = np.array([300, 300])
+        mrt = np.array([310, 310])
+        va = np.array([0, -10])  # negative va values are treated as 0
+        bgt = tmf.calculate_bgt(t2_k, mrt, va)
+        # without convection the globe temperature is the mean radiant one
+        assert bgt == pytest.approx(mrt, abs=1e-6)
+        # missing temperature or wind speed is not mistaken for calm wind
+        bgt = tmf.calculate_bgt(np.array([np.nan, 300]), mrt, np.array([3, np.nan]))
+        assert np.isnan(bgt).all()
+
+    def test_bgt_scalar(self):
+        bgt = tmf.calculate_bgt(300.0, 310.0, 3.0)
+        assert np.ndim(bgt) == 0
+        assert bgt == pytest.approx(302.32272581674357, abs=1e-6)
+        bgt = tmf.calculate_bgt(300.0, 310.0, 0.0)
+        assert np.ndim(bgt) == 0
+        assert bgt == pytest.approx(310.0, abs=1e-6)
+
     def test_wbgt(self):
         t2_k = np.array([300])
         td_k = np.array([290])
@@ -167,6 +206,12 @@ class TestThermalCalculator(unittest.TestCase):
         # print(f"hi {hi}")
         assert hi == pytest.approx(294.68866082, abs=1e-6)
 
+    def test_heat_index_simplified_scalar(self):
+        t2_k = tmf.celsius_to_kelvin(21.0)
+        hi = tmf.calculate_heat_index_simplified(t2_k, 80.0)
+        assert np.ndim(hi) == 0
+        assert hi == pytest.approx(294.68866082, abs=1e-6)
+
     def test_heat_index_adjusted(self):
         t2_k = np.array([295])
         td_k = np.array([290])
@@ -174,6 +219,11 @@ class TestThermalCalculator(unittest.TestCase):
         # print(f"hia {hia}")
         assert hia[0] == pytest.approx(295.15355699, abs=1e-6)
 
+    def test_heat_index_adjusted_scalar(self):
+        hia = tmf.calculate_heat_index_adjusted(295.0, 290.0)
+        assert np.ndim(hia) == 0
+        assert hia == pytest.approx(295.15355699, abs=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
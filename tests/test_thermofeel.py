@@ -78,6 +78,12 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("es.csv", es)
         self.assert_equal(self.es, es)
 
+    def test_saturation_vapour_pressure_int16(self):
+        t2m = np.round(self.t2m)
+        es = tmf.calculate_saturation_vapour_pressure(t2m.astype(np.int16))
+        # np.log of int16 inputs is evaluated in float32
+        self.assert_equal(tmf.calculate_saturation_vapour_pressure(t2m), es, decimal=4)
+
     def test_saturation_vapour_pressure_multiphase(self):
         es_multiphase = tmf.calculate_saturation_vapour_pressure_multiphase(
             self.t2m, self.phase
@@ -85,6 +91,16 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("es_multiphase.csv", es_multiphase)
         self.assert_equal(self.es_multiphase, es_multiphase)
 
+    def test_saturation_vapour_pressure_multiphase_masked(self):
+        mask = np.arange(self.t2m.size) % 3 == 0
+        t2m = np.ma.masked_array(np.where(mask, 1e20, self.t2m), mask=mask)
+        es_multiphase = tmf.calculate_saturation_vapour_pressure_multiphase(
+            t2m, self.phase
+        )
+        self.assertIsInstance(es_multiphase, np.ma.MaskedArray)
+        np.testing.assert_array_equal(mask, np.ma.getmaskarray(es_multiphase))
+        self.assert_equal(self.es_multiphase[~mask], es_multiphase.compressed())
+
     def test_nonsaturation_vapour_pressure(self):
         rh = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
         ens = tmf.calculate_nonsaturation_vapour_pressure(self.t2m, rh)
@@ -113,6 +129,36 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("mrtr.csv", mrtr)
         self.assert_equal(self.mrtr, mrtr)  # , decimal = 3)
 
+    def test_mean_radiant_temperature_float32(self):
+        f = np.float32(1 / 3600)
+        mrtr = tmf.calculate_mean_radiant_temperature(
+            ssrd=self.ssrd.astype(np.float32) * f,
+            ssr=self.ssr.astype(np.float32) * f,
+            dsrp=self.dsrp.astype(np.float32) * f,
+            strd=self.strd.astype(np.float32) * f,
+            fdir=self.fdir.astype(np.float32) * f,
+            strr=self.strr.astype(np.float32) * f,
+            cossza=self.cossza.astype(np.float32) * f,
+        )
+        self.assertEqual(mrtr.dtype, np.float32)
+        self.assert_equal(self.mrtr, mrtr, decimal=3)
+
+    def test_mean_radiant_temperature_masked(self):
+        mask = np.arange(self.ssrd.size) % 3 == 0
+        ssrd = np.ma.masked_array(np.where(mask, 1e20, self.ssrd), mask=mask)
+        mrtr = tmf.calculate_mean_radiant_temperature(
+            ssrd=ssrd / 3600,
+            ssr=self.ssr / 3600,
+            dsrp=self.dsrp / 3600,
+            strd=self.strd / 3600,
+            fdir=self.fdir / 3600,
+            strr=self.strr / 3600,
+            cossza=self.cossza / 3600,
+        )
+        self.assertIsInstance(mrtr, np.ma.MaskedArray)
+        np.testing.assert_array_equal(mask, np.ma.getmaskarray(mrtr))
+        self.assert_equal(self.mrtr[~mask], mrtr.compressed())
+
     def test_utci(self):
         rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
         ehPa = tmf.calculate_saturation_vapour_pressure(self.t2m) * rh_pc / 100.0
@@ -122,12 +168,59 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("utci.csv", utci)
         self.assert_equal(self.utci, utci)
 
+    def test_utci_large_arrays(self):
+        # tiled inputs go through the blocked Horner evaluation of the polynomial
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_saturation_vapour_pressure(self.t2m) * rh_pc / 100.0
+        utci = tmf.calculate_utci(
+            t2_k=np.tile(self.t2m, 400),
+            va=np.tile(self.va, 400),
+            mrt=np.tile(self.mrt, 400),
+            td_k=None,
+            ehPa=np.tile(ehPa, 400),
+        )
+        self.assert_equal(np.tile(self.utci, 400), utci)
+
+    def test_utci_masked(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_saturation_vapour_pressure(self.t2m) * rh_pc / 100.0
+        mask = np.arange(self.t2m.size) % 3 == 0
+        # masked points hold invalid data which must not leak into the others
+        t2m = np.ma.masked_array(np.where(mask, 1e20, self.t2m), mask=mask)
+        utci = tmf.calculate_utci(
+            t2_k=t2m, va=self.va, mrt=self.mrt, td_k=None, ehPa=ehPa
+        )
+        self.assertIsInstance(utci, np.ma.MaskedArray)
+        np.testing.assert_array_equal(mask, np.ma.getmaskarray(utci))
+        self.assert_equal(self.utci[~mask], utci.compressed())
+
+    def test_utci_float32(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_saturation_vapour_pressure(self.t2m) * rh_pc / 100.0
+        utci = tmf.calculate_utci(
+            t2_k=self.t2m.astype(np.float32),
+            va=self.va.astype(np.float32),
+            mrt=self.mrt.astype(np.float32),
+            td_k=None,
+            ehPa=ehPa.astype(np.float32),
+        )
+        self.assertEqual(utci.dtype, np.float32)
+        self.assert_equal(self.utci, utci, decimal=2)
+
     def test_wbgt_simple(self):
         rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
         wbgts = tmf.calculate_wbgt_simple(self.t2m, rh_pc)
         # np.savetxt("wbgts.csv", wbgts)
         self.assert_equal(self.wbgts, wbgts)
 
+    def test_wbgt_simple_from_vapour_pressure(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_nonsaturation_vapour_pressure(self.t2m, rh_pc)
+        wbgts = tmf.calculate_wbgt_simple(self.t2m, ehPa=ehPa)
+        self.assert_equal(self.wbgts, wbgts)
+        with self.assertRaises(ValueError):
+            tmf.calculate_wbgt_simple(self.t2m)
+
     def test_wbt(self):
         rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
         wbt = tmf.calculate_wbt(self.t2m, rh_pc)
@@ -144,6 +237,13 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("wbgt.csv", wbgt)
         self.assert_equal(self.wbgt, wbgt)
 
+    def test_wbgt_from_relative_humidity(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        wbgt = tmf.calculate_wbgt(self.t2m, self.mrt, self.va, rh=rh_pc)
+        self.assert_equal(self.wbgt, wbgt)
+        with self.assertRaises(ValueError):
+            tmf.calculate_wbgt(self.t2m, self.mrt, self.va)
+
     def test_mrt_from_bgt(self):
         mrt_from_bgt = tmf.calculate_mrt_from_bgt(self.t2m, self.bgt, self.va)
         # np.savetxt("mrt_from_bgt.csv", mrt_from_bgt)
@@ -166,6 +266,14 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("at.csv", at)
         self.assert_equal(self.at, at)
 
+    def test_apparent_temperature_from_vapour_pressure(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        ehPa = tmf.calculate_nonsaturation_vapour_pressure(self.t2m, rh_pc)
+        at = tmf.calculate_apparent_temperature(self.t2m, self.va, ehPa=ehPa)
+        self.assert_equal(self.at, at)
+        with self.assertRaises(ValueError):
+            tmf.calculate_apparent_temperature(self.t2m, self.va)
+
     def test_wind_chill(self):
         windchill = tmf.calculate_wind_chill(self.t2m, self.va)
         # np.savetxt("windchill.csv", windchill)
@@ -182,6 +290,13 @@ class TestThermalCalculator(unittest.TestCase):
         # np.savetxt("hia.csv", hia)
         self.assert_equal(self.heatindexadjusted, hia)
 
+    def test_heat_index_adjusted_from_relative_humidity(self):
+        rh_pc = tmf.calculate_relative_humidity_percent(self.t2m, self.td)
+        hia = tmf.calculate_heat_index_adjusted(self.t2m, rh=rh_pc)
+        self.assert_equal(self.heatindexadjusted, hia)
+        with self.assertRaises(ValueError):
+            tmf.calculate_heat_index_adjusted(self.t2m)
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
@@ -32,6 +32,7 @@
     earthkit-meteo library (github.com:ecmwf/earthkit-meteo.git)
   """
 
+import functools
 import math
 
 import numpy as np
@@ -46,6 +47,51 @@ from .helpers import (
 to_radians = math.pi / 180.0
 
 
+def _scalar_or_array(func):
+    """
+    Decorator for functions relying on array indexing,
+    so that scalar inputs are evaluated as 1-element arrays and a scalar is returned
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if any(np.ndim(x) for x in (*args, *kwargs.values())):
+            return func(*args, **kwargs)
+        args = [None if x is None else np.atleast_1d(x) for x in args]
+        kwargs = {k: None if x is None else np.atleast_1d(x) for k, x in kwargs.items()}
+        return func(*args, **kwargs)[0]
+
+    return wrapper
+
+
+def _preserve_mask(func):
+    """
+    Decorator for functions relying on plain ndarray buffers, so that masked array
+    inputs are evaluated on their data filled with 0 and the result is masked
+    wherever any of the inputs is
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        def filled(x):
+            return np.ma.filled(x, 0) if isinstance(x, np.ma.MaskedArray) else x
+
+        masked = [
+            x for x in (*args, *kwargs.values()) if isinstance(x, np.ma.MaskedArray)
+        ]
+        if not masked:
+            return func(*args, **kwargs)
+        args = [filled(x) for x in args]
+        kwargs = {k: filled(x) for k, x in kwargs.items()}
+        result = func(*args, **kwargs)
+        mask = np.zeros(np.shape(result), dtype=bool)
+        for x in masked:
+            mask |= np.ma.getmaskarray(x)
+        return np.ma.masked_array(result, mask=mask)
+
+    return wrapper
+
+
 def calculate_relative_humidity_percent(t2_k, td_k):
     """
     Relative Humidity in percent
@@ -56,11 +102,9 @@ def calculate_relative_humidity_percent(t2_k, td_k):
 
     t2_c = kelvin_to_celsius(t2_k)
     td_c = kelvin_to_celsius(td_k)
-    # saturated vapour pressure
-    es = 6.11 * 10.0 ** (7.5 * t2_c / (237.3 + t2_c))
-    # vapour pressure
-    e = 6.11 * 10.0 ** (7.5 * td_c / (237.3 + td_c))
-    rh = (e / es) * 100
+    # ratio of vapour pressure e = 6.11 * 10.0 ** (7.5 * td_c / (237.3 + td_c))
+    # to saturated vapour pressure es = 6.11 * 10.0 ** (7.5 * t2_c / (237.3 + t2_c))
+    rh = 10.0 ** (7.5 * td_c / (237.3 + td_c) - 7.5 * t2_c / (237.3 + t2_c)) * 100
     return rh
 
 
@@ -83,15 +127,18 @@ def calculate_saturation_vapour_pressure(t2_k):
         -1.8680009e-13,
         2.7150305,
     ]
-    ess = g[7] * np.log(t2_k)
-    for i in range(7):
-        ess += g[i] * np.power(t2_k, (i - 2))
+    # sum of g[i] * t2_k**(i - 2) in Horner form, avoiding the evaluation of powers
+    ess = g[6]
+    for i in range(5, -1, -1):
+        ess = ess * t2_k + g[i]
+    ess = ess / t2_k / t2_k + g[7] * np.log(t2_k)
 
     ess = np.exp(ess) * 0.01  # hPa
 
     return ess
 
 
+@_preserve_mask
 def calculate_saturation_vapour_pressure_multiphase(t2_k, phase):
     """
     Saturation vapour pressure over liquid water and ice
@@ -102,11 +149,11 @@ def calculate_saturation_vapour_pressure_multiphase(t2_k, phase):
     https://doi.org/10.21957/4whwo8jw0
     """
 
-    es = np.zeros_like(t2_k)
-    y = (t2_k - 273.16) / (t2_k - 32.19)  # over liquid water
-    es[phase == 0] = 6.1121 * np.exp(17.502 * y[phase == 0])
-    y = (t2_k - 273.16) / (t2_k + 0.7)  # over ice
-    es[phase == 1] = 6.1121 * np.exp(22.587 * y[phase == 1])
+    over_ice = phase == 1
+    a = np.where(over_ice, 22.587, 17.502)  # over ice, over liquid water
+    b = np.where(over_ice, -0.7, 32.19)
+    es = 6.1121 * np.exp(a * (t2_k - 273.16) / (t2_k - b))
+    es = np.where(over_ice | (phase == 0), es, 0.0)[()]  # a scalar for scalar inputs
 
     return es
 
@@ -132,17 +179,19 @@ def scale_windspeed(va, h):
     Scaling wind speed from 10 metres to height h
         :param va: (float array) 10m wind speed [m/s]
         :param h: (float array) height at which wind speed needs to be scaled [m]
-        returns wind speed at height h
+        returns wind speed at height h, negative values being treated as 0
     Reference: Bröde et al. (2012)
     https://doi.org/10.1007/s00484-011-0454-1
     """
     c = 1 / np.log10(10 / 0.01)  #
     c = 0.333333333333
-    vh = va * np.log10(h / 0.01) * c
+    # the height factor is evaluated first, for scalar h a single product over va
+    vh = np.maximum(va * (np.log10(h / 0.01) * c), 0.0)
 
     return vh
 
 
+@_scalar_or_array
 def approximate_dsrp(fdir, cossza, threshold=0.1):
     """
     Helper function to approximate dsrp from fdir and cossza
@@ -169,15 +218,13 @@ def calculate_dew_point_from_relative_humidity(rh, t2_k):
     https://doi.org/10.1175/1520-0450(1996)035<0601:IMFAOS>2.0.CO;2
     """
     t2_c = kelvin_to_celsius(t2_k)
-    td_c = (
-        243.04
-        * (np.log(rh / 100) + ((17.625 * t2_c) / (243.04 + t2_c)))
-        / (17.625 - np.log(rh / 100) - ((17.625 * t2_c) / (243.04 + t2_c)))
-    )
+    x = np.log(rh / 100) + ((17.625 * t2_c) / (243.04 + t2_c))
+    td_c = 243.04 * x / (17.625 - x)
     td_k = celsius_to_kelvin(td_c)
     return td_k
 
 
+@_preserve_mask
 def calculate_mean_radiant_temperature(ssrd, ssr, dsrp, strd, fdir, strr, cossza):
     """
     MRT - Mean Radiant Temperature
@@ -193,287 +240,354 @@ def calculate_mean_radiant_temperature(ssrd, ssr, dsrp, strd, fdir, strr, cossza
     https://link.springer.com/article/10.1007/s00484-020-01900-5
     """
 
-    dsw = ssrd - fdir
-    rsw = ssrd - ssr
-    lur = strd - strr
-    # Istar = dsrp
+    # all the terms are accumulated in two preallocated buffers,
+    # in single precision if all the inputs are
+    inputs = [np.asarray(x) for x in (ssrd, ssr, dsrp, strd, fdir, strr, cossza)]
+    shape = np.broadcast_shapes(*(x.shape for x in inputs))
+    dtype = np.result_type(*inputs, np.float32)
+    fp = np.empty(shape, dtype=dtype)
+    mrt = np.empty(shape, dtype=dtype)
 
     # calculate fp projected factor area
-
-    gamma = np.arcsin(cossza) * 180 / np.pi
-    fp = 0.308 * np.cos(to_radians * gamma * (0.998 - gamma * gamma / 50000))
+    # fp = 0.308 * cos(to_radians * gamma * (0.998 - gamma * gamma / 50000))
+    gamma = np.multiply(np.arcsin(cossza, out=fp), 180 / np.pi, out=fp)
+    np.multiply(gamma, gamma, out=mrt)
+    np.multiply(mrt, -1 / 50000, out=mrt)
+    np.add(mrt, 0.998, out=mrt)
+    np.multiply(mrt, gamma, out=mrt)
+    np.multiply(mrt, to_radians, out=mrt)
+    fp = np.multiply(np.cos(mrt, out=mrt), 0.308, out=fp)
 
     # calculate mean radiant temperature
-    mrt = np.power(
-        (
-            (1 / 0.0000000567)
-            * (
-                0.5 * strd
-                + 0.5 * lur
-                + (0.7 / 0.97) * (0.5 * dsw + 0.5 * rsw + fp * dsrp)
-            )
-        ),
-        0.25,
-    )
+    # mrt = ((1 / 0.0000000567) * (0.5 * strd + 0.5 * lur
+    #        + (0.7 / 0.97) * (0.5 * dsw + 0.5 * rsw + fp * dsrp))) ** 0.25
+    # where dsw = ssrd - fdir, rsw = ssrd - ssr and lur = strd - strr, i.e.
+    # 0.5 * strd + 0.5 * lur = strd - 0.5 * strr
+    # 0.5 * dsw + 0.5 * rsw = ssrd - 0.5 * (fdir + ssr)
+    np.multiply(fp, dsrp, out=mrt)
+    np.add(mrt, ssrd, out=mrt)
+    np.subtract(mrt, np.multiply(np.add(fdir, ssr, out=fp), 0.5, out=fp), out=mrt)
+    np.multiply(mrt, 0.7 / 0.97, out=mrt)
+    np.add(mrt, strd, out=mrt)
+    np.subtract(mrt, np.multiply(strr, 0.5, out=fp), out=mrt)
+    np.multiply(mrt, 1 / 0.0000000567, out=mrt)
+    np.sqrt(np.sqrt(mrt, out=mrt), out=mrt)  # fourth root
+
+    return mrt[()]  # a scalar for scalar inputs
+
+
+# UTCI polynomial approximation of Broede et al. (2012) as a table of terms
+# [coefficient, exponent of t2m, exponent of va, exponent of e_mrt, exponent of rh]
+_UTCI_TERMS = np.array(
+    [
+        [6.07562052e-01, 0, 0, 0, 0],
+        [-2.27712343e-02, 1, 0, 0, 0],
+        [8.06470249e-04, 2, 0, 0, 0],
+        [-1.54271372e-04, 3, 0, 0, 0],
+        [-3.24651735e-06, 4, 0, 0, 0],
+        [7.32602852e-08, 5, 0, 0, 0],
+        [1.35959073e-09, 6, 0, 0, 0],
+        [-2.25836520e00, 0, 1, 0, 0],
+        [8.80326035e-02, 1, 1, 0, 0],
+        [2.16844454e-03, 2, 1, 0, 0],
+        [-1.53347087e-05, 3, 1, 0, 0],
+        [-5.72983704e-07, 4, 1, 0, 0],
+        [-2.55090145e-09, 5, 1, 0, 0],
+        [-7.51269505e-01, 0, 2, 0, 0],
+        [-4.08350271e-03, 1, 2, 0, 0],
+        [-5.21670675e-05, 2, 2, 0, 0],
+        [1.94544667e-06, 3, 2, 0, 0],
+        [1.14099531e-08, 4, 2, 0, 0],
+        [1.58137256e-01, 0, 3, 0, 0],
+        [-6.57263143e-05, 1, 3, 0, 0],
+        [2.22697524e-07, 2, 3, 0, 0],
+        [-4.16117031e-08, 3, 3, 0, 0],
+        [-1.27762753e-02, 0, 4, 0, 0],
+        [9.66891875e-06, 1, 4, 0, 0],
+        [2.52785852e-09, 2, 4, 0, 0],
+        [4.56306672e-04, 0, 5, 0, 0],
+        [-1.74202546e-07, 1, 5, 0, 0],
+        [-5.91491269e-06, 0, 6, 0, 0],
+        [3.98374029e-01, 0, 0, 1, 0],
+        [1.83945314e-04, 1, 0, 1, 0],
+        [-1.73754510e-04, 2, 0, 1, 0],
+        [-7.60781159e-07, 3, 0, 1, 0],
+        [3.77830287e-08, 4, 0, 1, 0],
+        [5.43079673e-10, 5, 0, 1, 0],
+        [-2.00518269e-02, 0, 1, 1, 0],
+        [8.92859837e-04, 1, 1, 1, 0],
+        [3.45433048e-06, 2, 1, 1, 0],
+        [-3.77925774e-07, 3, 1, 1, 0],
+        [-1.69699377e-09, 4, 1, 1, 0],
+        [1.69992415e-04, 0, 2, 1, 0],
+        [-4.99204314e-05, 1, 2, 1, 0],
+        [2.47417178e-07, 2, 2, 1, 0],
+        [1.07596466e-08, 3, 2, 1, 0],
+        [8.49242932e-05, 0, 3, 1, 0],
+        [1.35191328e-06, 1, 3, 1, 0],
+        [-6.21531254e-09, 2, 3, 1, 0],
+        [-4.99410301e-06, 0, 4, 1, 0],
+        [-1.89489258e-08, 1, 4, 1, 0],
+        [8.15300114e-08, 0, 5, 1, 0],
+        [7.55043090e-04, 0, 0, 2, 0],
+        [-5.65095215e-05, 1, 0, 2, 0],
+        [-4.52166564e-07, 1, 0, 2, 0],
+        [2.46688878e-08, 3, 0, 2, 0],
+        [2.42674348e-10, 4, 0, 2, 0],
+        [1.54547250e-04, 0, 1, 2, 0],
+        [5.24110970e-06, 1, 1, 2, 0],
+        [-8.75874982e-08, 2, 1, 2, 0],
+        [-1.50743064e-09, 3, 1, 2, 0],
+        [-1.56236307e-05, 0, 2, 2, 0],
+        [-1.33895614e-07, 1, 2, 2, 0],
+        [2.49709824e-09, 2, 2, 2, 0],
+        [6.51711721e-07, 0, 3, 2, 0],
+        [1.94960053e-09, 1, 3, 2, 0],
+        [-1.00361113e-08, 0, 4, 2, 0],
+        [-1.21206673e-05, 0, 0, 3, 0],
+        [-2.18203660e-07, 1, 0, 3, 0],
+        [7.51269482e-09, 2, 0, 3, 0],
+        [9.79063848e-11, 3, 0, 3, 0],
+        [1.25006734e-06, 0, 1, 3, 0],
+        [-1.81584736e-09, 1, 1, 3, 0],
+        [-3.52197671e-10, 2, 1, 3, 0],
+        [-3.36514630e-08, 0, 2, 3, 0],
+        [1.35908359e-10, 1, 2, 3, 0],
+        [4.17032620e-10, 0, 3, 3, 0],
+        [-1.30369025e-09, 0, 0, 4, 0],
+        [4.13908461e-10, 1, 0, 4, 0],
+        [9.22652254e-12, 2, 0, 4, 0],
+        [-5.08220384e-09, 0, 1, 4, 0],
+        [-2.24730961e-11, 1, 1, 4, 0],
+        [1.17139133e-10, 0, 2, 4, 0],
+        [6.62154879e-10, 0, 0, 5, 0],
+        [4.03863260e-13, 1, 0, 5, 0],
+        [1.95087203e-12, 0, 1, 5, 0],
+        [-4.73602469e-12, 0, 0, 6, 0],
+        [5.12733497e00, 0, 0, 0, 1],
+        [-3.12788561e-01, 1, 0, 0, 1],
+        [-1.96701861e-02, 2, 0, 0, 1],
+        [9.99690870e-04, 3, 0, 0, 1],
+        [9.51738512e-06, 4, 0, 0, 1],
+        [-4.66426341e-07, 5, 0, 0, 1],
+        [5.48050612e-01, 0, 1, 0, 1],
+        [-3.30552823e-03, 1, 1, 0, 1],
+        [-1.64119440e-03, 2, 1, 0, 1],
+        [-5.16670694e-06, 3, 1, 0, 1],
+        [9.52692432e-07, 4, 1, 0, 1],
+        [-4.29223622e-02, 0, 2, 0, 1],
+        [5.00845667e-03, 1, 2, 0, 1],
+        [1.00601257e-06, 2, 2, 0, 1],
+        [-1.81748644e-06, 3, 2, 0, 1],
+        [-1.25813502e-03, 0, 3, 0, 1],
+        [-1.79330391e-04, 1, 3, 0, 1],
+        [2.34994441e-06, 2, 3, 0, 1],
+        [1.29735808e-04, 0, 4, 0, 1],
+        [1.29064870e-06, 1, 4, 0, 1],
+        [-2.28558686e-06, 0, 5, 0, 1],
+        [-3.69476348e-02, 0, 0, 1, 1],
+        [1.62325322e-03, 1, 0, 1, 1],
+        [-3.14279680e-05, 2, 0, 1, 1],
+        [2.59835559e-06, 3, 0, 1, 1],
+        [-4.77136523e-08, 4, 0, 1, 1],
+        [8.64203390e-03, 0, 1, 1, 1],
+        [-6.87405181e-04, 1, 1, 1, 1],
+        [-9.13863872e-06, 2, 1, 1, 1],
+        [5.15916806e-07, 3, 1, 1, 1],
+        [-3.59217476e-05, 0, 2, 1, 1],
+        [3.28696511e-05, 1, 2, 1, 1],
+        [-7.10542454e-07, 2, 2, 1, 1],
+        [-1.24382300e-05, 0, 3, 1, 1],
+        [-7.38584400e-09, 1, 3, 1, 1],
+        [2.20609296e-07, 0, 4, 1, 1],
+        [-7.32469180e-04, 0, 0, 2, 1],
+        [-1.87381964e-05, 1, 0, 2, 1],
+        [4.80925239e-06, 2, 0, 2, 1],
+        [-8.75492040e-08, 3, 0, 2, 1],
+        [2.77862930e-05, 0, 1, 2, 1],
+        [-5.06004592e-06, 1, 1, 2, 1],
+        [1.14325367e-07, 2, 1, 2, 1],
+        [2.53016723e-06, 0, 2, 2, 1],
+        [-1.72857035e-08, 1, 2, 2, 1],
+        [-3.95079398e-08, 0, 3, 2, 1],
+        [-3.59413173e-07, 0, 0, 3, 1],
+        [7.04388046e-07, 1, 0, 3, 1],
+        [-1.89309167e-08, 2, 0, 3, 1],
+        [-4.79768731e-07, 0, 1, 3, 1],
+        [7.96079978e-09, 1, 1, 3, 1],
+        [1.62897058e-09, 0, 2, 3, 1],
+        [3.94367674e-08, 0, 0, 4, 1],
+        [-1.18566247e-09, 1, 0, 4, 1],
+        [3.34678041e-10, 0, 1, 4, 1],
+        [-1.15606447e-10, 0, 0, 5, 1],
+        [-2.80626406e00, 0, 0, 0, 2],
+        [5.48712484e-01, 1, 0, 0, 2],
+        [-3.99428410e-03, 2, 0, 0, 2],
+        [-9.54009191e-04, 3, 0, 0, 2],
+        [1.93090978e-05, 4, 0, 0, 2],
+        [-3.08806365e-01, 0, 1, 0, 2],
+        [1.16952364e-02, 1, 1, 0, 2],
+        [4.95271903e-04, 2, 1, 0, 2],
+        [-1.90710882e-05, 3, 1, 0, 2],
+        [2.10787756e-03, 0, 2, 0, 2],
+        [-6.98445738e-04, 1, 2, 0, 2],
+        [2.30109073e-05, 2, 2, 0, 2],
+        [4.17856590e-04, 0, 3, 0, 2],
+        [-1.27043871e-05, 1, 3, 0, 2],
+        [-3.04620472e-06, 0, 4, 0, 2],
+        [5.14507424e-02, 0, 0, 1, 2],
+        [-4.32510997e-03, 1, 0, 1, 2],
+        [8.99281156e-05, 2, 0, 1, 2],
+        [-7.14663943e-07, 3, 0, 1, 2],
+        [-2.66016305e-04, 0, 1, 1, 2],
+        [2.63789586e-04, 1, 1, 1, 2],
+        [-7.01199003e-06, 2, 1, 1, 2],
+        [-1.06823306e-04, 0, 2, 1, 2],
+        [3.61341136e-06, 1, 2, 1, 2],
+        [2.29748967e-07, 0, 3, 1, 2],
+        [3.04788893e-04, 0, 0, 2, 2],
+        [-6.42070836e-05, 1, 0, 2, 2],
+        [1.16257971e-06, 2, 0, 2, 2],
+        [7.68023384e-06, 0, 1, 2, 2],
+        [-5.47446896e-07, 1, 1, 2, 2],
+        [-3.59937910e-08, 0, 2, 2, 2],
+        [-4.36497725e-06, 0, 0, 3, 2],
+        [1.68737969e-07, 1, 0, 3, 2],
+        [2.67489271e-08, 0, 1, 3, 2],
+        [3.23926897e-09, 0, 0, 4, 2],
+        [-3.53874123e-02, 0, 0, 0, 3],
+        [-2.21201190e-01, 1, 0, 0, 3],
+        [1.55126038e-02, 2, 0, 0, 3],
+        [-2.63917279e-04, 3, 0, 0, 3],
+        [4.53433455e-02, 0, 1, 0, 3],
+        [-4.32943862e-03, 1, 1, 0, 3],
+        [1.45389826e-04, 2, 1, 0, 3],
+        [2.17508610e-04, 0, 2, 0, 3],
+        [-6.66724702e-05, 1, 2, 0, 3],
+        [3.33217140e-05, 0, 3, 0, 3],
+        [-2.26921615e-03, 0, 0, 1, 3],
+        [3.80261982e-04, 1, 0, 1, 3],
+        [-5.45314314e-09, 2, 0, 1, 3],
+        [-7.96355448e-04, 0, 1, 1, 3],
+        [2.53458034e-05, 1, 1, 1, 3],
+        [-6.31223658e-06, 0, 2, 1, 3],
+        [3.02122035e-04, 0, 0, 2, 3],
+        [-4.77403547e-06, 1, 0, 2, 3],
+        [1.73825715e-06, 0, 1, 2, 3],
+        [-4.09087898e-07, 0, 0, 3, 3],
+        [6.14155345e-01, 0, 0, 0, 4],
+        [-6.16755931e-02, 1, 0, 0, 4],
+        [1.33374846e-03, 2, 0, 0, 4],
+        [3.55375387e-03, 0, 1, 0, 4],
+        [-5.13027851e-04, 1, 1, 0, 4],
+        [1.02449757e-04, 0, 2, 0, 4],
+        [-1.48526421e-03, 0, 0, 1, 4],
+        [-4.11469183e-05, 1, 0, 1, 4],
+        [-6.80434415e-06, 0, 1, 1, 4],
+        [-9.77675906e-06, 0, 0, 2, 4],
+        [8.82773108e-02, 0, 0, 0, 5],
+        [-3.01859306e-03, 1, 0, 0, 5],
+        [1.04452989e-03, 0, 1, 0, 5],
+        [2.47090539e-04, 0, 0, 1, 5],
+        [1.48348065e-03, 0, 0, 0, 6],
+    ]
+)
+_UTCI_COEFFICIENTS = _UTCI_TERMS[:, 0]
+_UTCI_EXPONENTS = _UTCI_TERMS[:, 1:].astype(np.int8)
+
+
+def _horner_scheme(coeffs):
+    """
+    Nested Horner scheme of a dense multivariate polynomial
+        :param coeffs: (float array) coefficients, axis i indexing the powers of the i-th variable
+        returns the coefficients of the first variable powers up to the highest non-zero one,
+        each being a float for univariate polynomials or else a nested scheme (None if zero)
+    """
+    degrees = np.flatnonzero(coeffs.reshape(len(coeffs), -1).any(axis=1))
+    if coeffs.ndim == 1:
+        return [float(c) for c in coeffs[: degrees[-1] + 1]]
+    return [_horner_scheme(c) if c.any() else None for c in coeffs[: degrees[-1] + 1]]
+
+
+def _horner(scheme, variables, shape):
+    """
+    Evaluates a nested Horner scheme
+        :param scheme: (list) nested Horner scheme as returned by _horner_scheme
+        :param variables: (tuple of float arrays) polynomial variables
+        :param shape: (tuple) broadcast shape of the variables
+        returns the evaluated polynomial
+    """
+    x = variables[0]
+    result = np.zeros(shape, dtype=x.dtype)
+    for term in reversed(scheme):
+        np.multiply(result, x, out=result)
+        if len(variables) == 1:
+            np.add(result, term, out=result)
+        elif term is not None:
+            np.add(result, _horner(term, variables[1:], shape), out=result)
+
+    return result
+
+
+# dense coefficients indexed [va, rh, e_mrt, t2m] for nested Horner evaluation
+_UTCI_DENSE = np.zeros((7, 7, 7, 7))
+np.add.at(_UTCI_DENSE, tuple(_UTCI_EXPONENTS[:, [1, 3, 2, 0]].T), _UTCI_COEFFICIENTS)
+_UTCI_HORNER = _horner_scheme(_UTCI_DENSE)
+
+
+# below this number of points the UTCI polynomial is evaluated with a single
+# product over all terms, as the Horner scheme cost is dominated by ufunc calls
+_UTCI_SMALL_SIZE = 128
 
-    return mrt
+# above it, the Horner scheme is evaluated over blocks of points small enough
+# for its intermediate buffers to stay in cache
+_UTCI_BLOCK_SIZE = 16384
 
 
+def _utci_monomials(variables):
+    """
+    Monomials of the UTCI polynomial
+        :param variables: (tuple of float arrays) t2m, va, e_mrt and rh of the same shape
+        returns the monomials of every term in _UTCI_TERMS along the last axis
+    """
+    monomials = 1.0
+    for x, exponents in zip(variables, _UTCI_EXPONENTS.T):
+        powers = x[..., None] ** np.arange(7, dtype=x.dtype)
+        monomials = monomials * powers[..., exponents]
+    return monomials
+
+
+@_preserve_mask
 def calculate_utci_polynomial(t2m, mrt, va, rh):
+    """
+    UTCI polynomial approximation
+        :param t2m: (float array) 2m temperature [°C]
+        :param mrt: (float array) mean radiant temperature [°C]
+        :param va: (float array) wind speed at 10 meters [m/s]
+        :param rh: (float array) water vapour pressure [kPa]
+        returns UTCI [°C]
+    Reference: Brode et al. (2012)
+    https://doi.org/10.1007/s00484-011-0454-1
+    """
+    # evaluated in single precision if all the inputs are
+    inputs = [np.asarray(x) for x in (t2m, mrt, va, rh)]
+    dtype = np.result_type(*inputs, np.float32)
+    t2m, mrt, va, rh = np.broadcast_arrays(*(x.astype(dtype) for x in inputs))
     e_mrt = np.subtract(mrt, t2m)
 
-    t2m2 = t2m * t2m
-    t2m3 = t2m2 * t2m
-    t2m4 = t2m3 * t2m
-    t2m5 = t2m4 * t2m
-    t2m6 = t2m5 * t2m
-
-    va2 = va * va
-    va3 = va2 * va
-    va4 = va3 * va
-    va5 = va4 * va
-    va6 = va5 * va
-
-    e_mrt2 = e_mrt * e_mrt
-    e_mrt3 = e_mrt2 * e_mrt
-    e_mrt4 = e_mrt3 * e_mrt
-    e_mrt5 = e_mrt4 * e_mrt
-    e_mrt6 = e_mrt5 * e_mrt
-
-    rh2 = rh * rh
-    rh3 = rh2 * rh
-    rh4 = rh3 * rh
-    rh5 = rh4 * rh
-    rh6 = rh5 * rh
-
-    varh2 = va * rh2
-    va2_rh = va2 * rh
-    va2_e_mrt = va2 * e_mrt
-    e_mrt_rh = e_mrt * rh
-    e_mrt_rh2 = e_mrt * rh2
-    e_mrt2_rh = e_mrt2 * rh
-    e_mrt2_rh2 = e_mrt2 * rh2
-    e_mrt_rh3 = e_mrt * rh3
-    va_e_mrt = va * e_mrt
-    va_e_mrt2 = va * e_mrt2
-    va_rh = va * rh
-    t2m_va = t2m * va
-    e_mrt3_rh = e_mrt3 * rh
-    e_mrt4_rh = e_mrt4 * rh
-
-    utci = (
-        t2m
-        + 6.07562052e-01
-        + -2.27712343e-02 * t2m
-        + 8.06470249e-04 * t2m2
-        + -1.54271372e-04 * t2m3
-        + -3.24651735e-06 * t2m4
-        + 7.32602852e-08 * t2m5
-        + 1.35959073e-09 * t2m6
-        + -2.25836520e00 * va
-        + 8.80326035e-02 * t2m * va
-        + 2.16844454e-03 * t2m2 * va
-        + -1.53347087e-05 * t2m3 * va
-        + -5.72983704e-07 * t2m4 * va
-        + -2.55090145e-09 * t2m5 * va
-        + -7.51269505e-01 * va2
-        + -4.08350271e-03 * t2m * va2
-        + -5.21670675e-05 * t2m2 * va2
-        + 1.94544667e-06 * t2m3 * va2
-        + 1.14099531e-08 * t2m4 * va2
-        + 1.58137256e-01 * va3
-        + -6.57263143e-05 * t2m * va3
-        + 2.22697524e-07 * t2m2 * va3
-        + -4.16117031e-08 * t2m3 * va3
-        + -1.27762753e-02 * va4
-        + 9.66891875e-06 * t2m * va4
-        + 2.52785852e-09 * t2m2 * va4
-        + 4.56306672e-04 * va5
-        + -1.74202546e-07 * t2m * va5
-        + -5.91491269e-06 * va6
-        + 3.98374029e-01 * e_mrt
-        + 1.83945314e-04 * t2m * e_mrt
-        + -1.73754510e-04 * t2m2 * e_mrt
-        + -7.60781159e-07 * t2m3 * e_mrt
-        + 3.77830287e-08 * t2m4 * e_mrt
-        + 5.43079673e-10 * t2m5 * e_mrt
-        + -2.00518269e-02 * va_e_mrt
-        + 8.92859837e-04 * t2m * va_e_mrt
-        + 3.45433048e-06 * t2m2 * va_e_mrt
-        + -3.77925774e-07 * t2m3 * va_e_mrt
-        + -1.69699377e-09 * t2m4 * va_e_mrt
-        + 1.69992415e-04 * va2_e_mrt
-        + -4.99204314e-05 * t2m * va2_e_mrt
-        + 2.47417178e-07 * t2m2 * va2_e_mrt
-        + 1.07596466e-08 * t2m3 * va2_e_mrt
-        + 8.49242932e-05 * va3 * e_mrt
-        + 1.35191328e-06 * t2m * va3 * e_mrt
-        + -6.21531254e-09 * t2m2 * va3 * e_mrt
-        + -4.99410301e-06 * va4 * e_mrt
-        + -1.89489258e-08 * t2m * va4 * e_mrt
-        + 8.15300114e-08 * va5 * e_mrt
-        + 7.55043090e-04 * e_mrt2
-        + -5.65095215e-05 * t2m * e_mrt2
-        + -4.52166564e-07 * t2m * e_mrt2
-        + 2.46688878e-08 * t2m3 * e_mrt2
-        + 2.42674348e-10 * t2m4 * e_mrt2
-        + 1.54547250e-04 * va_e_mrt2
-        + 5.24110970e-06 * t2m * va_e_mrt2
-        + -8.75874982e-08 * t2m2 * va_e_mrt2
-        + -1.50743064e-09 * t2m3 * va_e_mrt2
-        + -1.56236307e-05 * va2 * e_mrt2
-        + -1.33895614e-07 * t2m * va2 * e_mrt2
-        + 2.49709824e-09 * t2m2 * va2 * e_mrt2
-        + 6.51711721e-07 * va3 * e_mrt2
-        + 1.94960053e-09 * t2m * va3 * e_mrt2
-        + -1.00361113e-08 * va4 * e_mrt2
-        + -1.21206673e-05 * e_mrt3
-        + -2.18203660e-07 * t2m * e_mrt3
-        + 7.51269482e-09 * t2m2 * e_mrt3
-        + 9.79063848e-11 * t2m3 * e_mrt3
-        + 1.25006734e-06 * va * e_mrt3
-        + -1.81584736e-09 * t2m_va * e_mrt3
-        + -3.52197671e-10 * t2m2 * va * e_mrt3
-        + -3.36514630e-08 * va2 * e_mrt3
-        + 1.35908359e-10 * t2m * va2 * e_mrt3
-        + 4.17032620e-10 * va3 * e_mrt3
-        + -1.30369025e-09 * e_mrt4
-        + 4.13908461e-10 * t2m * e_mrt4
-        + 9.22652254e-12 * t2m2 * e_mrt4
-        + -5.08220384e-09 * va * e_mrt4
-        + -2.24730961e-11 * t2m_va * e_mrt4
-        + 1.17139133e-10 * va2 * e_mrt4
-        + 6.62154879e-10 * e_mrt5
-        + 4.03863260e-13 * t2m * e_mrt5
-        + 1.95087203e-12 * va * e_mrt5
-        + -4.73602469e-12 * e_mrt6
-        + 5.12733497e00 * rh
-        + -3.12788561e-01 * t2m * rh
-        + -1.96701861e-02 * t2m2 * rh
-        + 9.99690870e-04 * t2m3 * rh
-        + 9.51738512e-06 * t2m4 * rh
-        + -4.66426341e-07 * t2m5 * rh
-        + 5.48050612e-01 * va_rh
-        + -3.30552823e-03 * t2m * va_rh
-        + -1.64119440e-03 * t2m2 * va_rh
-        + -5.16670694e-06 * t2m3 * va_rh
-        + 9.52692432e-07 * t2m4 * va_rh
-        + -4.29223622e-02 * va2_rh
-        + 5.00845667e-03 * t2m * va2_rh
-        + 1.00601257e-06 * t2m2 * va2_rh
-        + -1.81748644e-06 * t2m3 * va2_rh
-        + -1.25813502e-03 * va3 * rh
-        + -1.79330391e-04 * t2m * va3 * rh
-        + 2.34994441e-06 * t2m2 * va3 * rh
-        + 1.29735808e-04 * va4 * rh
-        + 1.29064870e-06 * t2m * va4 * rh
-        + -2.28558686e-06 * va5 * rh
-        + -3.69476348e-02 * e_mrt_rh
-        + 1.62325322e-03 * t2m * e_mrt_rh
-        + -3.14279680e-05 * t2m2 * e_mrt_rh
-        + 2.59835559e-06 * t2m3 * e_mrt_rh
-        + -4.77136523e-08 * t2m4 * e_mrt_rh
-        + 8.64203390e-03 * va * e_mrt_rh
-        + -6.87405181e-04 * t2m_va * e_mrt_rh
-        + -9.13863872e-06 * t2m2 * va * e_mrt_rh
-        + 5.15916806e-07 * t2m3 * va * e_mrt_rh
-        + -3.59217476e-05 * va2 * e_mrt_rh
-        + 3.28696511e-05 * t2m * va2 * e_mrt_rh
-        + -7.10542454e-07 * t2m2 * va2 * e_mrt_rh
-        + -1.24382300e-05 * va3 * e_mrt_rh
-        + -7.38584400e-09 * t2m * va3 * e_mrt_rh
-        + 2.20609296e-07 * va4 * e_mrt_rh
-        + -7.32469180e-04 * e_mrt2_rh
-        + -1.87381964e-05 * t2m * e_mrt2_rh
-        + 4.80925239e-06 * t2m2 * e_mrt2_rh
-        + -8.75492040e-08 * t2m3 * e_mrt2_rh
-        + 2.77862930e-05 * va * e_mrt2_rh
-        + -5.06004592e-06 * t2m_va * e_mrt2_rh
-        + 1.14325367e-07 * t2m2 * va * e_mrt2_rh
-        + 2.53016723e-06 * va2 * e_mrt2_rh
-        + -1.72857035e-08 * t2m * va2 * e_mrt2_rh
-        + -3.95079398e-08 * va3 * e_mrt2_rh
-        + -3.59413173e-07 * e_mrt3_rh
-        + 7.04388046e-07 * t2m * e_mrt3_rh
-        + -1.89309167e-08 * t2m2 * e_mrt3_rh
-        + -4.79768731e-07 * va * e_mrt3_rh
-        + 7.96079978e-09 * t2m_va * e_mrt3_rh
-        + 1.62897058e-09 * va2 * e_mrt3_rh
-        + 3.94367674e-08 * e_mrt4_rh
-        + -1.18566247e-09 * t2m * e_mrt4_rh
-        + 3.34678041e-10 * va * e_mrt4_rh
-        + -1.15606447e-10 * e_mrt5 * rh
-        + -2.80626406e00 * rh2
-        + 5.48712484e-01 * t2m * rh2
-        + -3.99428410e-03 * t2m2 * rh2
-        + -9.54009191e-04 * t2m3 * rh2
-        + 1.93090978e-05 * t2m4 * rh2
-        + -3.08806365e-01 * varh2
-        + 1.16952364e-02 * t2m * varh2
-        + 4.95271903e-04 * t2m2 * varh2
-        + -1.90710882e-05 * t2m3 * varh2
-        + 2.10787756e-03 * va2 * rh2
-        + -6.98445738e-04 * t2m * va2 * rh2
-        + 2.30109073e-05 * t2m2 * va2 * rh2
-        + 4.17856590e-04 * va3 * rh2
-        + -1.27043871e-05 * t2m * va3 * rh2
-        + -3.04620472e-06 * va4 * rh2
-        + 5.14507424e-02 * e_mrt_rh2
-        + -4.32510997e-03 * t2m * e_mrt_rh2
-        + 8.99281156e-05 * t2m2 * e_mrt_rh2
-        + -7.14663943e-07 * t2m3 * e_mrt_rh2
-        + -2.66016305e-04 * va * e_mrt_rh2
-        + 2.63789586e-04 * t2m_va * e_mrt_rh2
-        + -7.01199003e-06 * t2m2 * va * e_mrt_rh2
-        + -1.06823306e-04 * va2 * e_mrt_rh2
-        + 3.61341136e-06 * t2m * va2 * e_mrt_rh2
-        + 2.29748967e-07 * va3 * e_mrt_rh2
-        + 3.04788893e-04 * e_mrt2_rh2
-        + -6.42070836e-05 * t2m * e_mrt2_rh2
-        + 1.16257971e-06 * t2m2 * e_mrt2_rh2
-        + 7.68023384e-06 * va * e_mrt2_rh2
-        + -5.47446896e-07 * t2m_va * e_mrt2_rh2
-        + -3.59937910e-08 * va2 * e_mrt2_rh2
-        + -4.36497725e-06 * e_mrt3 * rh2
-        + 1.68737969e-07 * t2m * e_mrt3 * rh2
-        + 2.67489271e-08 * va * e_mrt3 * rh2
-        + 3.23926897e-09 * e_mrt4 * rh2
-        + -3.53874123e-02 * rh3
-        + -2.21201190e-01 * t2m * rh3
-        + 1.55126038e-02 * t2m2 * rh3
-        + -2.63917279e-04 * t2m3 * rh3
-        + 4.53433455e-02 * va * rh3
-        + -4.32943862e-03 * t2m_va * rh3
-        + 1.45389826e-04 * t2m2 * va * rh3
-        + 2.17508610e-04 * va2 * rh3
-        + -6.66724702e-05 * t2m * va2 * rh3
-        + 3.33217140e-05 * va3 * rh3
-        + -2.26921615e-03 * e_mrt_rh3
-        + 3.80261982e-04 * t2m * e_mrt_rh3
-        + -5.45314314e-09 * t2m2 * e_mrt_rh3
-        + -7.96355448e-04 * va * e_mrt_rh3
-        + 2.53458034e-05 * t2m_va * e_mrt_rh3
-        + -6.31223658e-06 * va2 * e_mrt_rh3
-        + 3.02122035e-04 * e_mrt2 * rh3
-        + -4.77403547e-06 * t2m * e_mrt2 * rh3
-        + 1.73825715e-06 * va * e_mrt2 * rh3
-        + -4.09087898e-07 * e_mrt3 * rh3
-        + 6.14155345e-01 * rh4
-        + -6.16755931e-02 * t2m * rh4
-        + 1.33374846e-03 * t2m2 * rh4
-        + 3.55375387e-03 * va * rh4
-        + -5.13027851e-04 * t2m_va * rh4
-        + 1.02449757e-04 * va2 * rh4
-        + -1.48526421e-03 * e_mrt * rh4
-        + -4.11469183e-05 * t2m * e_mrt * rh4
-        + -6.80434415e-06 * va * e_mrt * rh4
-        + -9.77675906e-06 * e_mrt2 * rh4
-        + 8.82773108e-02 * rh5
-        + -3.01859306e-03 * t2m * rh5
-        + 1.04452989e-03 * va * rh5
-        + 2.47090539e-04 * e_mrt * rh5
-        + 1.48348065e-03 * rh6
-    )
+    if t2m.size < _UTCI_SMALL_SIZE:
+        coeffs = _UTCI_COEFFICIENTS.astype(dtype)
+        utci = _utci_monomials((t2m, va, e_mrt, rh)) @ coeffs + t2m
+    else:
+        utci = np.empty(t2m.shape, dtype=dtype)
+        flat = utci.reshape(-1)
+        variables = [np.ravel(x) for x in (va, rh, e_mrt, t2m)]
+        for start in range(0, flat.size, _UTCI_BLOCK_SIZE):
+            block = [x[start : start + _UTCI_BLOCK_SIZE] for x in variables]
+            flat[start : start + _UTCI_BLOCK_SIZE] = _horner(
+                _UTCI_HORNER, block, block[0].shape
+            )
+        np.add(utci, t2m, out=utci)
 
     return utci
 
@@ -510,20 +624,25 @@ def calculate_utci(t2_k, va, mrt, td_k=None, ehPa=None):
     return utci_k
 
 
-def calculate_wbgt_simple(t2_k, rh):
+def calculate_wbgt_simple(t2_k, rh=None, ehPa=None):
     """
     WBGT - Wet Bulb Globe Temperature computed by a the simpler algorithm
         :param t2_k: (float array) 2m temperature [K]
         :param rh: (float array) relative humidity percentage [%]
+        :param ehPa: (float array) non saturated vapour pressure [hPa], computed from rh if not given
         returns Wet Bulb Globe Temperature [K]
     Reference: ACSM (1984)
     https://doi.org/10.1080/00913847.1984.11701899
     See also: http://www.bom.gov.au/info/thermal_stress/#approximation
     https://www.jstage.jst.go.jp/article/indhealth/50/4/50_MS1352/_pdf
     """
+    if ehPa is None:
+        if rh is None:
+            raise ValueError("Missing input ehPa or rh")
+        ehPa = calculate_nonsaturation_vapour_pressure(t2_k, rh)
+
     t2_c = kelvin_to_celsius(t2_k)
-    e = calculate_nonsaturation_vapour_pressure(t2_k, rh)
-    wbgt = 0.567 * t2_c + 0.393 * e + 3.94
+    wbgt = 0.567 * t2_c + 0.393 * ehPa + 3.94
     wbgt_k = celsius_to_kelvin(wbgt)
 
     return wbgt_k
@@ -543,7 +662,7 @@ def calculate_wbt(t2_k, rh):
         t2_c * np.arctan(0.151977 * np.sqrt(rh + 8.313659))
         + np.arctan(t2_c + rh)
         - np.arctan(rh - 1.676331)
-        + 0.00391838 * (rh) ** (3 / 2) * np.arctan(0.023101 * rh)
+        + 0.00391838 * rh * np.sqrt(rh) * np.arctan(0.023101 * rh)
         - 4.686035
     )
     tw_k = celsius_to_kelvin(tw)
@@ -551,6 +670,11 @@ def calculate_wbt(t2_k, rh):
     return tw_k
 
 
+# convective heat transfer term of the globe energy balance, without wind speed
+_BGT_CONVECTION = 1.1e8 / (0.95 * 0.15**0.4)
+
+
+@_preserve_mask
 def calculate_bgt(t2_k, mrt, va):
     """
     Globe temperature
@@ -565,16 +689,22 @@ def calculate_bgt(t2_k, mrt, va):
         va, 1.1
     )  # formula requires wind speed at 1.1m (i.e., at the level of the globe)
 
-    # a = 1
-    d = (1.1e8 * v**0.6) / (0.95 * 0.15**0.4)
-    e = -(mrt**4) - d * t2_k
+    # closed-form root of bgt**4 + d * bgt + e = 0 (i.e., a = 1)
+    d = _BGT_CONVECTION * v**0.6
+    # without wind (d = 0) the root degenerates to 0 / 0,
+    # there is no convection and the globe temperature is the mean radiant one
+    calm = d == 0
+    d = np.where(calm, 1.0, d)  # placeholder, overridden below
+    mrt2 = mrt * mrt
+    e = -(mrt2 * mrt2) - d * t2_k
 
     q = 12 * e
-    s = 27 * (d**2)
-    delta = ((s + np.sqrt(s**2 - 4 * (q**3))) / 2) ** (1 / 3)
-    Q = 0.5 * np.sqrt((1 / 3) * (delta + q / delta))
-
-    bgt = -Q + 0.5 * np.sqrt(-4 * (Q**2) + d / Q)
+    s = 27 * (d * d)
+    delta = np.cbrt((s + np.sqrt(s * s - 4 * (q * q * q))) / 2)
+    Q2 = (delta + q / delta) / 12
+    Q = np.sqrt(Q2)
+    bgt = -Q + 0.5 * np.sqrt(-4 * Q2 + d / Q)
+    bgt = np.where(calm, mrt, bgt)[()]  # a scalar for scalar inputs
 
     # f = (1.1e8 * va**0.6) / (0.95 * 0.15**0.4)
     # a = f / 2
@@ -598,23 +728,28 @@ def calculate_bgt(t2_k, mrt, va):
     return bgt
 
 
-def calculate_wbgt(t2_k, mrt, va, td_k):
+def calculate_wbgt(t2_k, mrt, va, td_k=None, rh=None):
     """
     WBGT - Wet Bulb Globe Temperature
         :param t2_k: (float array) 2m temperature [K]
         :param mrt: (float array) mean radiant temperature [K]
         :param va: (float array) wind speed at 10 meters [m/s]
         :param td_k: (float array) dew point temperature [K]
+        :param rh: (float array) relative humidity percentage [%], computed from td_k if not given
         returns wet bulb globe temperature [K]
     Reference: Stull (2011)
     https://doi.org/10.1175/JAMC-D-11-0143.1
     See also: http://www.bom.gov.au/info/thermal_stress/
     """
 
+    if rh is None:
+        if td_k is None:
+            raise ValueError("Missing input rh or td_k")
+        rh = calculate_relative_humidity_percent(t2_k, td_k)
+
     bgt_k = calculate_bgt(t2_k, mrt, va)
     bgt_c = kelvin_to_celsius(bgt_k)
 
-    rh = calculate_relative_humidity_percent(t2_k, td_k)
     t2_c = kelvin_to_celsius(t2_k)
     tw_k = calculate_wbt(t2_k, rh)
     tw_c = kelvin_to_celsius(tw_k)
@@ -638,7 +773,7 @@ def calculate_mrt_from_bgt(t2_k, bgt_k, va):
     v = scale_windspeed(
         va, 1.1
     )  # formula requires wind speed at 1.1m (i.e., at the level of the globe)
-    f = (1.1e8 * v**0.6) / (0.95 * 0.15**0.4)
+    f = _BGT_CONVECTION * v**0.6
     bgt4 = bgt_k**4
     mrtc = bgt4 + f * (bgt_k - t2_k)
     mrtc2 = np.sqrt(np.sqrt(mrtc))
@@ -685,20 +820,25 @@ def calculate_normal_effective_temperature(t2_k, va, rh):
     return net_k
 
 
-def calculate_apparent_temperature(t2_k, va, rh):
+def calculate_apparent_temperature(t2_k, va, rh=None, ehPa=None):
     """
     Apparent Temperature - version without radiation
         :param t2_k: (float array) 2m temperature [K]
         :param va: (float array) wind speed at 10 meters [m/s]
         :param rh: (float array) relative humidity percentage [%]
+        :param ehPa: (float array) non saturated vapour pressure [hPa], computed from rh if not given
         returns apparent temperature [K]
     Reference: Steadman (1984)
     https://doi.org/10.1175/1520-0450(1984)023%3C1674:AUSOAT%3E2.0.CO;2
     See also: http://www.bom.gov.au/info/thermal_stress/#atapproximation
     """
+    if ehPa is None:
+        if rh is None:
+            raise ValueError("Missing input ehPa or rh")
+        ehPa = calculate_nonsaturation_vapour_pressure(t2_k, rh)
+
     t2_c = kelvin_to_celsius(t2_k)
-    e = calculate_nonsaturation_vapour_pressure(t2_k, rh)
-    at = t2_c + 0.33 * e - 0.7 * va - 4
+    at = t2_c + 0.33 * ehPa - 0.7 * va - 4
     at_k = celsius_to_kelvin(at)
 
     return at_k
@@ -724,6 +864,7 @@ def calculate_wind_chill(t2_k, va):
     return windchill_k
 
 
+@_scalar_or_array
 def calculate_heat_index_simplified(t2_k, rh):
     """
     Heat Index
@@ -751,16 +892,15 @@ def calculate_heat_index_simplified(t2_k, rh):
 
     hi_filter1 = np.where(t2_c > 20)
 
-    hi[hi_filter1] = (
-        -hiarray[0]
-        + hiarray[1] * t2_c[hi_filter1]
-        + hiarray[2] * rh[hi_filter1]
-        - hiarray[3] * t2_c[hi_filter1] * rh[hi_filter1]
-        - hiarray[4] * t2_c[hi_filter1] ** 2
-        - hiarray[5] * rh[hi_filter1] ** 2
-        + hiarray[6] * t2_c[hi_filter1] ** 2 * rh[hi_filter1]
-        + hiarray[7] * t2_c[hi_filter1] * rh[hi_filter1] ** 2
-        - hiarray[8] * t2_c[hi_filter1] ** 2 * rh[hi_filter1] ** 2
+    t = t2_c[hi_filter1]
+    r = rh[hi_filter1]
+    # Horner form in rh and t2_c of
+    # - hiarray[0] + hiarray[1] * t + hiarray[2] * r - hiarray[3] * t * r
+    # - hiarray[4] * t**2 - hiarray[5] * r**2 + hiarray[6] * t**2 * r
+    # + hiarray[7] * t * r**2 - hiarray[8] * t**2 * r**2
+    hi[hi_filter1] = (-hiarray[0] + t * (hiarray[1] - hiarray[4] * t)) + r * (
+        (hiarray[2] + t * (-hiarray[3] + hiarray[6] * t))
+        + r * (-hiarray[5] + t * (hiarray[7] - hiarray[8] * t))
     )
 
     hi_k = celsius_to_kelvin(hi)
@@ -768,16 +908,21 @@ def calculate_heat_index_simplified(t2_k, rh):
     return hi_k
 
 
-def calculate_heat_index_adjusted(t2_k, td_k):
+@_scalar_or_array
+def calculate_heat_index_adjusted(t2_k, td_k=None, rh=None):
     """
     Heat Index adjusted
        :param t2_k: (float array) 2m temperature [K]
        :param td_k: (float array) 2m dewpoint temperature  [K]
+       :param rh: (float array) relative humidity percentage [%], computed from td_k if not given
        returns heat index [K]
     Reference: https://www.wpc.ncep.noaa.gov/html/heatindex_equation.shtml
     """
 
-    rh = calculate_relative_humidity_percent(t2_k, td_k)
+    if rh is None:
+        if td_k is None:
+            raise ValueError("Missing input rh or td_k")
+        rh = calculate_relative_humidity_percent(t2_k, td_k)
     t2_f = kelvin_to_fahrenheit(t2_k)
 
     hiarray = [
@@ -794,16 +939,13 @@ def calculate_heat_index_adjusted(t2_k, td_k):
 
     hi_initial = 0.5 * (t2_f + 61 + ((t2_f - 68) * 1.2) + (rh * 0.094))
 
-    hi = (
-        -hiarray[0]
-        + hiarray[1] * t2_f
-        + hiarray[2] * rh
-        - hiarray[3] * t2_f * rh
-        - hiarray[4] * t2_f**2
-        - hiarray[5] * rh**2
-        + hiarray[6] * t2_f**2 * rh
-        + hiarray[7] * t2_f * rh**2
-        - hiarray[8] * t2_f**2 * rh**2
+    # Horner form in rh and t2_f of
+    # - hiarray[0] + hiarray[1] * t2_f + hiarray[2] * rh - hiarray[3] * t2_f * rh
+    # - hiarray[4] * t2_f**2 - hiarray[5] * rh**2 + hiarray[6] * t2_f**2 * rh
+    # + hiarray[7] * t2_f * rh**2 - hiarray[8] * t2_f**2 * rh**2
+    hi = (-hiarray[0] + t2_f * (hiarray[1] - hiarray[4] * t2_f)) + rh * (
+        (hiarray[2] + t2_f * (-hiarray[3] + hiarray[6] * t2_f))
+        + rh * (-hiarray[5] + t2_f * (hiarray[7] - hiarray[8] * t2_f))
     )
 
     hi_filter1 = np.where(t2_f > 80)